@@ -3,11 +3,11 @@
 import argparse
 from collections import defaultdict
 from ctypes import CDLL
+import functools
 import logging
 import os
 import re
 import sys
-import threading
 import typing as t
 
 # https://pycairo.readthedocs.io/en/latest/reference/index.html
@@ -27,7 +27,6 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Gtk4LayerShell", "1.0")
 # https://amolenaar.pages.gitlab.gnome.org/pygobject-docs/
 from gi.repository import Gio
-from gi.repository import GObject
 from gi.repository import Gdk
 from gi.repository import GLib
 from gi.repository import Gtk
@@ -40,16 +39,45 @@ from .version import __version__
 
 logger: logging.Logger = logging.getLogger(__name__)
 
-CONFIG_DIRS_SEARCH: list[str] = [
-    dir for dir in [
+# The anchorable edges; the bit at each index is used in the anchor masks
+# below.
+ANCHOR_EDGES: tuple = (Gtk4LayerShell.Edge.LEFT, Gtk4LayerShell.Edge.RIGHT,
+                       Gtk4LayerShell.Edge.TOP, Gtk4LayerShell.Edge.BOTTOM)
+
+# Tables for parse_show below; must agree with parsers["show"] in
+# get_parsers, which still provides the help text.  The position options map
+# to their bit in an anchor mask, indexed as in ANCHOR_EDGES.
+SHOW_EDGE_OPTS: dict[str, int] = {
+    "--left": 1,
+    "--right": 2,
+    "--top": 4,
+    "--bottom": 8,
+}
+SHOW_VALUE_OPTS: tuple[str, ...] = ("--class", "--end-mark", "--output",
+                                    "--sec", "--window-class")
+SHOW_SHORT_OPTS: dict[str, str] = {
+    "b": "--bottom",
+    "c": "--class",
+    "e": "--end-mark",
+    "l": "--left",
+    "m": "--markup",
+    "o": "--output",
+    "r": "--right",
+    "s": "--sec",
+    "t": "--top",
+    "w": "--window-class",
+}
+
+CONFIG_DIRS_SEARCH: tuple[str, ...] = tuple(
+    d for d in [
         os.path.expanduser("~/.wlosd/"),
-        os.path.expandvars("${XDG_CONFIG_HOME}/wlosd/") if "XDG_CONFIG_HOME" in
-        os.environ else None,
+        os.path.join(os.environ["XDG_CONFIG_HOME"], "wlosd/")
+        if "XDG_CONFIG_HOME" in os.environ else None,
         os.path.expanduser("~/.config/wlosd/"), "/etc/xdg/wlosd/"
-    ] if dir is not None
-]
+    ] if d)
 
 
+@functools.lru_cache(maxsize=8)
 def find_config_file(name: str) -> str | None:
     for directory in CONFIG_DIRS_SEARCH:
         path = os.path.join(directory, name)
@@ -58,30 +86,31 @@ def find_config_file(name: str) -> str | None:
     return None
 
 
-class Item(GObject.Object):
-    __gtype_name__ = "Item"  # Good practice for introspection
+class Item:
 
     def __init__(self, uid: str, text: str, is_markup: bool,
                  classes: t.Sequence[str]):
-        super().__init__()
-        self._uid: str = uid
-        self._text: str = text
-        self._is_markup: bool = is_markup
-        self._classes: t.Sequence[str] = classes
+        self.uid: str = uid
+        self.text: str = text
+        self.is_markup: bool = is_markup
+        self.classes: t.Sequence[str] = classes
 
-    @GObject.Property(type=str)
-    def uid(self):
-        return self._uid
+    def same_text(self, other: "Item") -> bool:
+        return self.text == other.text and self.is_markup == other.is_markup
+
+    def same_content(self, other: "Item") -> bool:
+        return self.same_text(other) and list(self.classes) == list(
+            other.classes)
 
     def create_label(self) -> Gtk.Label:
         label = Gtk.Label()
 
-        if self._is_markup:
-            label.set_markup(self._text)
+        if self.is_markup:
+            label.set_markup(self.text)
         else:
-            label.set_text(self._text)
+            label.set_text(self.text)
 
-        label.set_css_classes(self._classes)
+        label.set_css_classes(self.classes)
 
         return label
 
@@ -96,7 +125,25 @@ class MainApp(Gtk.Application):
 
         self._windows: dict[str, Gtk.Window] = {}
         self._show_timers: dict[str, dict[str, int]] = defaultdict(dict)
-        self._models: dict[str, Gio.ListStore] = {}
+        self._boxes: dict[str, Gtk.Box] = {}
+        # Hidden windows kept for reuse as (window, box, anchor mask), so a
+        # show shortly after a hide does not pay for a new Wayland surface
+        # and layer-shell initialisation.
+        self._window_pool: dict[str, tuple[Gtk.Window, Gtk.Box, int]] = {}
+        # Maps window uid and item uid to the currently showing item and its
+        # label (items with an empty uid are keyed by "").
+        self._items: dict[str, dict[str, tuple[Item,
+                                               Gtk.Label]]] = defaultdict(dict)
+        # All currently showing uids ("window_uid" and "window_uid.item_uid"),
+        # maintained incrementally as windows and items come and go.
+        self._uids: set[str] = set()
+
+        # Last presented (window_classes, output, position) per window, used
+        # to skip redundant layer-shell and compositor calls in on_show.
+        self._presented: dict[str, tuple] = {}
+        # Currently set anchors per window, as a bitmask over ANCHOR_EDGES
+        # (new windows start unanchored).
+        self._anchor_masks: dict[str, int] = defaultdict(int)
 
         display = Gdk.DisplayManager.get().get_default_display()
         if display is None:
@@ -105,24 +152,44 @@ class MainApp(Gtk.Application):
         assert display is not None
         self._display: Gdk.Display = display
 
+        self._monitors: Gio.ListModel = self._display.get_monitors()
+        self._monitors.connect("items-changed", self.on_monitors_changed)
+        # Maps connector name (e.g. DP-1) to monitor; rebuilt lazily after
+        # the monitors list changes.
+        self._monitor_by_connector: dict[str, Gdk.Monitor] | None = None
+
         self._css_file: str | None = css_file
         self._css_provider: Gtk.CssProvider | None = None
+        # mtime of the css file when it was last loaded, to skip reloads
+        # when the file has not changed.
+        self._css_mtime: float = 0.0
         if self._css_file is not None:
             self._css_provider = Gtk.CssProvider()
             self._css_provider.load_from_path(self._css_file)
+            try:
+                self._css_mtime = os.stat(self._css_file).st_mtime
+            except OSError:
+                pass
             Gtk.StyleContext.add_provider_for_display(
                 self._display, self._css_provider,
                 Gtk.STYLE_PROVIDER_PRIORITY_USER)
 
     def get_uids(self) -> t.Sequence[str]:
-        uids = []
-        for (window_uid, model) in self._models.items():
-            uids.append(window_uid)
-            for item in model:
-                assert isinstance(item, Item)
-                if item.uid:
-                    uids.append(window_uid + "." + item.uid)
-        return uids
+        return sorted(self._uids)
+
+    # pylint: disable-next=unused-argument
+    def on_monitors_changed(self, *args) -> None:
+        self._monitor_by_connector = None
+
+    def find_monitor(self, output: str) -> Gdk.Monitor | None:
+        if self._monitor_by_connector is None:
+            self._monitor_by_connector = {}
+            for monitor in self._monitors:
+                assert isinstance(monitor, Gdk.Monitor)
+                connector = monitor.get_connector()
+                if connector:
+                    self._monitor_by_connector[connector] = monitor
+        return self._monitor_by_connector.get(output)
 
     def cancel_hide_timer(self, window_uid: str, message_uid: str) -> None:
         if window_uid not in self._show_timers:
@@ -146,39 +213,83 @@ class MainApp(Gtk.Application):
             # pylint: disable-next=no-member
             surface.set_input_region(cairo.Region([]))
 
+    def retire_window(self, window_uid: str) -> None:
+        window = self._windows.pop(window_uid)
+        box = self._boxes.pop(window_uid)
+        for (_, label) in self._items.pop(window_uid, {}).values():
+            box.remove(label)
+        window.set_visible(False)
+        self._window_pool[window_uid] = (
+            window, box, self._anchor_masks.pop(window_uid, 0))
+
     def get_or_create_window(self, uid: str) -> Gtk.Window:
         if uid in self._windows:
             return self._windows[uid]
 
+        pooled = self._window_pool.pop(uid, None)
+        if pooled is not None:
+            (window, box, anchor_mask) = pooled
+            self._windows[uid] = window
+            self._boxes[uid] = box
+            self._anchor_masks[uid] = anchor_mask
+            self._uids.add(uid)
+            return window
+
         window = Gtk.Window(name=uid)
         window.connect("realize", self.set_input_region)
 
-        self._models[uid] = Gio.ListStore()
-        layout = Gtk.ListBox()
-        layout.bind_model(self._models[uid], lambda item: item.create_label())
-        window.set_child(layout)
+        self._boxes[uid] = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
+        window.set_child(self._boxes[uid])
 
         Gtk4LayerShell.init_for_window(window)
         Gtk4LayerShell.set_layer(window, Gtk4LayerShell.Layer.OVERLAY)
 
         self._windows[uid] = window
+        self._uids.add(uid)
         return window
 
-    def add_or_replace_item(self, uid: str, item: Item) -> None:
-        model = self._models[uid]
-        if not item.uid:
-            model.remove_all()
-            model.append(item)
-            return
-
-        found, index = model.find_with_equal_func(
-            item, (lambda lhs, rhs: lhs.uid == rhs.uid))
-        if found:
-            model.remove(index)
-            model.insert(index, item)
-            return
+    def add_or_replace_item(self, uid: str, item: Item) -> bool:
+        """Adds item's label to the window's box, returning True if it changed."""
+        box = self._boxes[uid]
+        items = self._items[uid]
 
-        self._models[uid].append(item)
+        if not item.uid:
+            old = items.get("")
+            if (old is not None and len(items) == 1 and
+                    item.same_content(old[0])):
+                return False
+            for (message_uid, (_, old_label)) in items.items():
+                box.remove(old_label)
+                if message_uid:
+                    self._uids.discard(uid + "." + message_uid)
+            items.clear()
+            label = item.create_label()
+            items[""] = (item, label)
+            box.append(label)
+            return True
+
+        old = items.get(item.uid)
+        if old is not None:
+            (old_item, old_label) = old
+            if item.same_content(old_item):
+                return False
+            if item.same_text(old_item):
+                # Only the css classes changed; restyle the existing label
+                # instead of re-creating it.
+                old_label.set_css_classes(item.classes)
+                items[item.uid] = (item, old_label)
+                return True
+            label = item.create_label()
+            box.insert_child_after(label, old_label.get_prev_sibling())
+            box.remove(old_label)
+            items[item.uid] = (item, label)
+            return True
+
+        label = item.create_label()
+        box.append(label)
+        items[item.uid] = (item, label)
+        self._uids.add(uid + "." + item.uid)
+        return True
 
     def on_activate(self, _src) -> None:
         self.hold()
@@ -190,33 +301,41 @@ class MainApp(Gtk.Application):
     # pylint: disable-next=too-many-arguments,too-many-positional-arguments
     def on_show(self, uid: str, item: Item, window_classes: t.Sequence[str],
                 hide_sec: float | None, output: str | None,
-                position: list) -> bool:
+                position_mask: int) -> bool:
         self.cancel_hide_timer(uid, item.uid)
 
+        created = uid not in self._windows
         window = self.get_or_create_window(uid)
-        window.set_css_classes(window_classes)
 
-        self.add_or_replace_item(uid, item)
+        items_changed = self.add_or_replace_item(uid, item)
 
-        if output:
-            found_monitor = False
-            for monitor in self._display.get_monitors():
-                assert isinstance(monitor, Gdk.Monitor)
-                if monitor.get_connector() == output:
-                    Gtk4LayerShell.set_monitor(window, monitor)
-                    break
-            if not found_monitor:
-                logger.warning("did not find output: %s", output)
-
-        for gtk_edge in [
-                Gtk4LayerShell.Edge.LEFT, Gtk4LayerShell.Edge.RIGHT,
-                Gtk4LayerShell.Edge.TOP, Gtk4LayerShell.Edge.BOTTOM
-        ]:
-            Gtk4LayerShell.set_anchor(window, gtk_edge, gtk_edge in position)
+        state = (tuple(window_classes), output, position_mask)
+        state_changed = self._presented.get(uid) != state
+        if state_changed:
+            self._presented[uid] = state
+            window.set_css_classes(window_classes)
 
-        # Make the window resize to match the labels.
-        window.set_default_size(1, 1)
-        window.present()
+            if output:
+                monitor = self.find_monitor(output)
+                if monitor is not None:
+                    Gtk4LayerShell.set_monitor(window, monitor)
+                else:
+                    logger.warning("did not find output: %s", output)
+
+            diff = self._anchor_masks[uid] ^ position_mask
+            if diff:
+                for (i, gtk_edge) in enumerate(ANCHOR_EDGES):
+                    if diff & (1 << i):
+                        Gtk4LayerShell.set_anchor(window, gtk_edge,
+                                                  bool(position_mask
+                                                       & (1 << i)))
+                self._anchor_masks[uid] = position_mask
+
+        if items_changed:
+            # Make the window resize to match the labels.
+            window.set_default_size(1, 1)
+        if created or items_changed or state_changed:
+            window.present()
 
         if hide_sec is not None:
             self._show_timers[uid][item.uid] = GLib.timeout_add(
@@ -226,27 +345,28 @@ class MainApp(Gtk.Application):
 
     def on_hide(self, window_uid, message_uid) -> bool:
         self.cancel_hide_timer(window_uid, message_uid)
-        if window_uid not in self._models:
+        if window_uid not in self._windows:
             logger.warning("no such uid: %s", window_uid)
             return GLib.SOURCE_REMOVE
 
         if message_uid:
-            found, index = self._models[window_uid].find_with_equal_func(
-                # The API docs say you can pass NULL (None?) instead of item (first argument).
-                # It does not seem to work in Python.
-                Item(message_uid, "", False, []) , lambda item, _: item.uid == message_uid)
-            if found:
-                self._models[window_uid].remove(index)
+            old = self._items[window_uid].pop(message_uid, None)
+            if old is not None:
+                self._boxes[window_uid].remove(old[1])
+                self._uids.discard(window_uid + "." + message_uid)
                 # Do we need to resize the window after removing a label?
-                if self._models[window_uid].props.n_items == 0:
-                    self._windows[window_uid].destroy()
-                    del self._windows[window_uid]
-                    del self._models[window_uid]
+                if not self._items[window_uid]:
+                    self.retire_window(window_uid)
+                    self._uids.discard(window_uid)
+                    self._presented.pop(window_uid, None)
             return GLib.SOURCE_REMOVE
 
-        self._windows[window_uid].destroy()
-        del self._windows[window_uid]
-        del self._models[window_uid]
+        for item_uid in self._items[window_uid]:
+            if item_uid:
+                self._uids.discard(window_uid + "." + item_uid)
+        self.retire_window(window_uid)
+        self._uids.discard(window_uid)
+        self._presented.pop(window_uid, None)
         return GLib.SOURCE_REMOVE
 
     def on_hide_uids(self, uids: t.Iterable[t.Tuple[str, str]]) -> bool:
@@ -257,16 +377,28 @@ class MainApp(Gtk.Application):
     def on_reload_css(self) -> bool:
         if self._css_provider is None or self._css_file is None:
             return GLib.SOURCE_REMOVE
+
+        try:
+            mtime = os.stat(self._css_file).st_mtime
+        except OSError as e:
+            logger.warning("cannot stat css file: %s", e)
+            return GLib.SOURCE_REMOVE
+
+        # Re-parsing the css triggers a style recomputation of all the
+        # windows; skip it when the file is unchanged.
+        if mtime == self._css_mtime:
+            return GLib.SOURCE_REMOVE
+
+        self._css_mtime = mtime
         self._css_provider.load_from_path(self._css_file)
         return GLib.SOURCE_REMOVE
 
 
 def split_uid(uid: str) -> t.Tuple[str, str]:
-    try:
-        winodw_uid, message_uid = uid.split(".", 1)
-    except ValueError:
-        winodw_uid, message_uid = uid, ""
-    return (winodw_uid, message_uid)
+    index = uid.find(".")
+    if index < 0:
+        return (uid, "")
+    return (uid[:index], uid[index + 1:])
 
 class ParsingError(Exception):
     @staticmethod
@@ -280,33 +412,35 @@ class ParsingError(Exception):
         return self.message
 
 
-def get_parsers():
-    commands = {
-        "exit": "Terminate the program.",
-        "help": "Display help information about cmd.",
-        "hide": "Hide messages.",
-        "list-uids": "List all currently showing uids.",
-        "quit": "Terminate the program.",
-        "reload-css": "Reload and reapply the css file.",
-        "show":
-            "Show a message."
-            " The following input lines will compose the message text."
-            " The text can include Pango markup."
-            " By default, lines are read until the first empty line."
-            " The --end-mark option can be used to change the end of input marker."
-            " By default, the message will be displayed in the centre of the"
-            " screen."
-            " Use the -t, -b, -l, -r options to change the position."
-            " A combination like -tl can be used to display the message in a"
-            " corner (top-left in this case)."
-            " The margin property in the style sheet can be used to further"
-            " adjust the position."
-            " A new message will replace previous message with the same uid."
-            " Messages with uids in the form 'list_uid.sub_uid' with the same"
-            " list_uid will display in a list (new messages appear below old messages)."
-            " Using the same sub_uid in the same list will replace the old entry.",
-    }
+COMMAND_DESCRIPTIONS: dict[str, str] = {
+    "exit": "Terminate the program.",
+    "help": "Display help information about cmd.",
+    "hide": "Hide messages.",
+    "list-uids": "List all currently showing uids.",
+    "quit": "Terminate the program.",
+    "reload-css": "Reload and reapply the css file.",
+    "show":
+        "Show a message."
+        " The following input lines will compose the message text."
+        " The text can include Pango markup."
+        " By default, lines are read until the first empty line."
+        " The --end-mark option can be used to change the end of input marker."
+        " By default, the message will be displayed in the centre of the"
+        " screen."
+        " Use the -t, -b, -l, -r options to change the position."
+        " A combination like -tl can be used to display the message in a"
+        " corner (top-left in this case)."
+        " The margin property in the style sheet can be used to further"
+        " adjust the position."
+        " A new message will replace previous message with the same uid."
+        " Messages with uids in the form 'list_uid.sub_uid' with the same"
+        " list_uid will display in a list (new messages appear below old messages)."
+        " Using the same sub_uid in the same list will replace the old entry.",
+}
+COMMANDS: tuple[str, ...] = tuple(COMMAND_DESCRIPTIONS)
 
+
+def get_parsers():
     parser = argparse.ArgumentParser(
         exit_on_error=False,
         add_help=False,
@@ -318,10 +452,10 @@ def get_parsers():
                                         required=True,
                                         title="Commands",
                                         metavar="cmd",
-                                        help=f"one of {{{','.join(commands)}}}")
+                                        help=f"one of {{{','.join(COMMANDS)}}}")
 
     parsers = {}
-    for cmd, description in commands.items():
+    for cmd, description in COMMAND_DESCRIPTIONS.items():
         parsers[cmd] = cmd_parsers.add_parser(cmd,
                                               prog=cmd,
                                               add_help=False,
@@ -330,8 +464,8 @@ def get_parsers():
 
     # yapf: disable
     parsers["help"].add_argument("help_cmd", default=None, nargs="?",
-                                 choices=([""] + list(commands)),
-                                 metavar=",".join(commands))
+                                 choices=(("",) + COMMANDS),
+                                 metavar=",".join(COMMANDS))
 
     parsers["show"].add_argument("-b", "--bottom", dest="position", default=[],
                                  action="append_const", const=Gtk4LayerShell.Edge.BOTTOM,
@@ -375,79 +509,267 @@ def get_parsers():
     return parser, parsers
 
 
-def cmds_listener(app: MainApp) -> None:
-    parser, sub_parsers = get_parsers()
-
-    while True:
-        cmd_line: str = sys.stdin.readline()
+def parse_show_option(args: argparse.Namespace, name: str, val: str) -> None:
+    match name:
+        case "--class":
+            args.classes.append(val)
+        case "--end-mark":
+            args.end_mark = val
+        case "--output":
+            args.output = val
+        case "--sec":
+            try:
+                args.sec = float(val)
+            except ValueError:
+                ParsingError.throw(
+                    f"argument -s/--sec: invalid float value: '{val}'")
+        case "--window-class":
+            args.window_classes.append(val)
+
+
+def parse_show(tokens: t.Sequence[str]) -> argparse.Namespace:
+    """Parses show's arguments.
+
+    A hand-rolled replacement for parsers["show"].parse_args, which is far
+    too slow for the hot path.
+    """
+    args = argparse.Namespace(position=0,
+                              classes=[],
+                              end_mark="",
+                              markup=False,
+                              output=None,
+                              sec=None,
+                              window_classes=[],
+                              uid=None)
+
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+
+        if token.startswith("--"):
+            (name, eq, val) = token.partition("=")
+            if name in SHOW_VALUE_OPTS:
+                if not eq:
+                    if i == len(tokens):
+                        ParsingError.throw(
+                            f"argument {name}: expected one argument")
+                    val = tokens[i]
+                    i += 1
+                parse_show_option(args, name, val)
+                continue
+            if eq:
+                ParsingError.throw(
+                    f"argument {name}: ignored explicit argument '{val}'")
+            if name in SHOW_EDGE_OPTS:
+                args.position |= SHOW_EDGE_OPTS[name]
+            elif name == "--markup":
+                args.markup = True
+            else:
+                ParsingError.throw(f"unrecognized arguments: {token}")
+        elif token.startswith("-") and token != "-":
+            j = 1
+            while j < len(token):
+                name = SHOW_SHORT_OPTS.get(token[j], "")
+                j += 1
+                if name in SHOW_EDGE_OPTS:
+                    args.position |= SHOW_EDGE_OPTS[name]
+                elif name == "--markup":
+                    args.markup = True
+                elif name:
+                    val = token[j:]
+                    j = len(token)
+                    if not val:
+                        if i == len(tokens):
+                            ParsingError.throw(
+                                f"argument {name}: expected one argument")
+                        val = tokens[i]
+                        i += 1
+                    parse_show_option(args, name, val)
+                else:
+                    ParsingError.throw(f"unrecognized arguments: {token}")
+        elif args.uid is None:
+            args.uid = token
+        else:
+            ParsingError.throw(f"unrecognized arguments: {token}")
+
+    if args.uid is None:
+        ParsingError.throw(
+            "the following arguments are required: uid[.subuid]")
+    return args
+
+
+def parse_hide(tokens: t.Sequence[str]) -> argparse.Namespace:
+    """Parses hide's arguments (see parse_show)."""
+    args = argparse.Namespace(regex=False, uids=[])
+    for token in tokens:
+        if token in ("-r", "--regex"):
+            args.regex = True
+        elif token.startswith("-") and token != "-":
+            ParsingError.throw(f"unrecognized arguments: {token}")
+        else:
+            args.uids.append(token)
+    if not args.uids:
+        ParsingError.throw("the following arguments are required: uid")
+    return args
+
+
+class CmdsListener:
+    """Reads and dispatches commands from stdin on the GLib main loop."""
+
+    # Commands that take no arguments and so need no parsing pass.
+    NO_ARGS_CMDS: tuple[str, ...] = ("exit", "quit", "list-uids", "reload-css")
+
+    def __init__(self, app: MainApp) -> None:
+        self._app: MainApp = app
+        self._parser, self._sub_parsers = get_parsers()
+
+        self._buffer: bytearray = bytearray()
+        # Set by exit/quit to stop watching stdin.
+        self._exiting: bool = False
+        # While a show command is reading its message text: the parsed
+        # arguments and the lines read so far.
+        self._pending_show: tuple[argparse.Namespace, list[str]] | None = None
+
+        self._fd: int = sys.stdin.fileno()
+        os.set_blocking(self._fd, False)
+        GLib.unix_fd_add_full(GLib.PRIORITY_DEFAULT, self._fd,
+                              GLib.IOCondition.IN | GLib.IOCondition.HUP,
+                              self.on_stdin_ready)
+
+    def on_stdin_ready(self, _fd: int, _condition: GLib.IOCondition) -> bool:
+        eof = False
+        while True:
+            try:
+                chunk = os.read(self._fd, 4096)
+            except BlockingIOError:
+                break
+            if not chunk:
+                eof = True
+                break
+            self._buffer += chunk
+
+        while (not self._exiting and
+               (index := self._buffer.find(b"\n")) >= 0):
+            line = self._buffer[:index].decode("utf-8", errors="replace")
+            del self._buffer[:index + 1]
+            self.on_line(line)
+
+        if self._exiting:
+            return GLib.SOURCE_REMOVE
 
-        if cmd_line == "":
+        if eof:
+            if self._buffer:
+                self.on_line(self._buffer.decode("utf-8", errors="replace"))
+                self._buffer.clear()
+            if self._pending_show is not None:
+                # EOF before the end-mark; show what was read, like the old
+                # blocking reader did.
+                self.finish_show()
             logger.info("stdin was closed")
-            GLib.idle_add(app.on_exit)
+            self._app.on_exit()
+            return GLib.SOURCE_REMOVE
+
+        return GLib.SOURCE_CONTINUE
+
+    def finish_show(self) -> None:
+        assert self._pending_show is not None
+        (args, lines) = self._pending_show
+        self._pending_show = None
+
+        window_uid, message_uid = split_uid(args.uid)
+        self._app.on_show(
+            window_uid,
+            Item(message_uid, "\n".join(lines), args.markup, args.classes),
+            args.window_classes, args.sec, args.output, args.position)
+
+    def on_line(self, line: str) -> None:
+        if self._pending_show is not None:
+            (args, lines) = self._pending_show
+            if line == args.end_mark:
+                self.finish_show()
+            else:
+                lines.append(line)
             return
 
-        try:
-            args = parser.parse_args(cmd_line.removesuffix("\n").split(" "))
-        except argparse.ArgumentError as e:
-            logger.warning("parsing error: %s", e)
-            continue
-        except argparse.ArgumentTypeError as e:
-            logger.warning("type error: %s", e)
-            continue
-        except ParsingError as e:
-            logger.warning("error: %s", e)
-            continue
-
-        match args.command:
-            case "exit" | "quit":
-                GLib.idle_add(app.on_exit)
+        tokens = line.split(" ")
+        command = tokens[0]
+
+        if command not in self._sub_parsers:
+            logger.warning("error: unknown command: %s", command)
+            return
+
+        if len(tokens) > 1 or command not in self.NO_ARGS_CMDS:
+            # Parse with the command's own parser, skipping the top-level
+            # subparser dispatch; show and hide have hand-rolled parsers as
+            # argparse is too slow for high-rate command streams.
+            try:
+                if command == "show":
+                    args = parse_show(tokens[1:])
+                elif command == "hide":
+                    args = parse_hide(tokens[1:])
+                else:
+                    args = self._sub_parsers[command].parse_args(tokens[1:])
+            except argparse.ArgumentError as e:
+                logger.warning("parsing error: %s", e)
+                return
+            except argparse.ArgumentTypeError as e:
+                logger.warning("type error: %s", e)
+                return
+            except ParsingError as e:
+                logger.warning("error: %s", e)
                 return
 
+        match command:
+            case "exit" | "quit":
+                self._exiting = True
+                self._app.on_exit()
+
             case "help":
                 if args.help_cmd:
-                    sub_parsers[args.help_cmd].print_help()
+                    self._sub_parsers[args.help_cmd].print_help()
                 else:
-                    parser.print_help()
+                    self._parser.print_help()
 
             case "hide":
-                hide_uids = [
-                    uid for uid in app.get_uids() if any(
-                        re.search(pattern, uid) for pattern in args.uids)
-                ] if args.regex else [
-                    uid for uid in args.uids if uid in app.get_uids()
-                ]
+                all_uids = self._app.get_uids()
+                if args.regex:
+                    # Compiled per pattern: joining them into one alternation
+                    # would renumber backreferences and reject patterns with
+                    # inline flags like (?i).
+                    try:
+                        searches = [
+                            re.compile(pattern).search
+                            for pattern in args.uids
+                        ]
+                    except re.error as e:
+                        logger.warning("bad regular expression: %s", e)
+                        return
+                    hide_uids = [
+                        uid for uid in all_uids if any(
+                            search(uid) for search in searches)
+                    ]
+                else:
+                    all_uids_set = set(all_uids)
+                    hide_uids = [
+                        uid for uid in args.uids if uid in all_uids_set
+                    ]
 
-                GLib.idle_add(app.on_hide_uids, [ split_uid(uid) for uid in hide_uids ])
+                self._app.on_hide_uids([split_uid(uid) for uid in hide_uids])
 
             case "list-uids":
-                list_uids = app.get_uids()
+                list_uids = self._app.get_uids()
                 if list_uids:
                     print("\n".join(list_uids))
 
             case "reload-css":
-                GLib.idle_add(app.on_reload_css)
+                self._app.on_reload_css()
 
             case "show":
-                window_uid, message_uid = split_uid(args.uid)
-                text = read_text(args.end_mark)
-
-                GLib.idle_add(app.on_show, window_uid,
-                              Item(message_uid, text, args.markup,
-                                   args.classes), args.window_classes, args.sec,
-                              args.output, args.position)
+                self._pending_show = (args, [])
 
             case _:
-                assert False, f"unknown command: {cmd_line}"
-
-
-def read_text(end_mark: str) -> str:
-    """Reads text from standard input until a specific end-mark is encountered."""
-    text = ""
-    for line in sys.stdin:
-        if line[:-1] == end_mark:
-            break
-        text += line
-    return text.removesuffix("\n")
+                assert False, f"unknown command: {line}"
 
 
 def main() -> None:
@@ -490,5 +812,6 @@ def main() -> None:
     app: MainApp = MainApp(args.css)
     app.connect("activate", app.on_activate)
 
-    threading.Thread(target=cmds_listener, args=(app,), daemon=True).start()
+    # The stdin watch keeps the listener alive for the life of the main loop.
+    CmdsListener(app)
     app.run(None)